@@ -1,3 +1,12 @@
+import sys
+
+# Exported attribute names found on each element class, and whether its instances only store attributes in slots.
+_EXPORT_ATTRIBUTES = {}
+
+# Number of sub elements above which an element indexes them by tag instead of scanning them on each lookup.
+_INDEX_THRESHOLD = 8
+
+
 class GedcomElement:
     """Class for representing a Gedcom element.
 
@@ -13,6 +22,21 @@ class GedcomElement:
     :rtype: GedcomElement
     """
 
+    __slots__ = (
+        "__level",
+        "__tag",
+        "__value",
+        "__sub_elements",
+        "__by_tag",
+        # Sub elements are turned into specialised elements (dates, places, ...) by switching their __class__,
+        # which requires the same memory layout: keep a lazily allocated __dict__ for those subclasses.
+        "__dict__",
+        "__weakref__",
+    )
+
+    # Classes used to build the direct sub elements of a given tag, plain GedcomElement otherwise.
+    _sub_element_classes = {}
+
     def __init__(
         self,
         level: int,
@@ -25,56 +49,65 @@ class GedcomElement:
         self.__tag = tag
         self.__value = value
         self.__sub_elements = []
+        self.__by_tag = None
         if sub_elements != []:
-            current_parsed_line = self.__parse_line(sub_elements[0])
+            sub_element_classes = self._sub_element_classes
+            current_level, _, current_tag, current_value = self.__parse_line(sub_elements[0])
             element_lines = []
-            level = current_parsed_line["level"]
             for line in sub_elements[1:]:
-                tmp_parsed_line = self.__parse_line(line)
-                if tmp_parsed_line["level"] > level:
+                tmp_level, _, tmp_tag, tmp_value = self.__parse_line(line)
+                if tmp_level > current_level:
                     element_lines.append(line)
                 else:
                     self.__sub_elements.append(
-                        GedcomElement(
-                            current_parsed_line["level"],
-                            current_parsed_line["tag"],
+                        sub_element_classes.get(current_tag, GedcomElement)(
+                            current_level,
+                            current_tag,
                             element_lines,
-                            value=current_parsed_line["value"],
+                            value=current_value,
                         )
                     )
-                    current_parsed_line = tmp_parsed_line
+                    current_level, current_tag, current_value = tmp_level, tmp_tag, tmp_value
                     element_lines = []
             self.__sub_elements.append(
-                GedcomElement(
-                    current_parsed_line["level"],
-                    current_parsed_line["tag"],
+                sub_element_classes.get(current_tag, GedcomElement)(
+                    current_level,
+                    current_tag,
                     element_lines,
-                    value=current_parsed_line["value"],
+                    value=current_value,
                 )
             )
 
-    def __parse_line(self, line: str) -> dict:
+    def __parse_line(self, line: str) -> tuple:
         """Parse a line of a Gedcom file.
 
         :param line: The line to parse.
         :type line: str
-        :return: The parsed line.
-        :rtype: dict
+        :return: The level, the xref, the tag and the value of the line.
+        :rtype: tuple
         """
-        chars = line.split(" ")
-        level = int(chars.pop(0))
-        xref = chars.pop(0) if chars[0].startswith("@") else None
-        tag = chars.pop(0)
-        value = " ".join(chars) if chars != [] else ""
-        return {"level": level, "xref": xref, "tag": tag, "value": value}
+        parts = line.split(" ", 2)
+        level = int(parts[0])
+        if parts[1][:1] == "@":
+            xref = parts[1]
+            parts = parts[2].split(" ", 1)
+        else:
+            xref = None
+            del parts[0]
+        tag = sys.intern(parts[0])
+        value = parts[1] if len(parts) > 1 else ""
+        return level, xref, tag, value
 
     def get_sub_elements(self):
         """Get the sub elements of the Gedcom element.
 
+        This is a copy: use add_sub_element and remove_sub_element to modify the sub elements, so that
+        find_sub_element stays up to date.
+
         :return: The sub elements of the Gedcom element.
         :rtype: list
         """
-        return self.__sub_elements
+        return list(self.__sub_elements)
 
     def add_sub_element(self, level, tag, sub_elements, value=None):
         """Add a sub element to the Gedcom element.
@@ -88,7 +121,10 @@ class GedcomElement:
         :param value: The value of the sub element. Defaults to None.
         :type value: str, optional
         """
-        self.__sub_elements.append(GedcomElement(level, tag, sub_elements, value))
+        element = self._sub_element_classes.get(tag, GedcomElement)(level, tag, sub_elements, value)
+        self.__sub_elements.append(element)
+        if self.__by_tag is not None:
+            self.__by_tag.setdefault(element.get_tag(), []).append(element)
 
     def remove_sub_element(self, element):
         """Remove a sub element from the Gedcom element.
@@ -97,16 +133,28 @@ class GedcomElement:
         :type element: GedcomElement
         """
         self.__sub_elements.remove(element)
+        if self.__by_tag is not None:
+            self.__by_tag[element.get_tag()].remove(element)
 
     def find_sub_element(self, tag: str) -> list:
         """Find a sub element by tag.
 
+        Elements with only a few sub elements are scanned. Larger ones build an index of their sub elements by tag
+        on first lookup, which is then kept up to date when sub elements are added or removed.
+
         :param tag: The tag of the sub element to find.
         :type tag: str
         :return: The sub element found.
         :rtype: list
         """
-        return [element for element in self.__sub_elements if element.get_tag() == tag]
+        if self.__by_tag is None:
+            if len(self.__sub_elements) <= _INDEX_THRESHOLD:
+                return [element for element in self.__sub_elements if element.get_tag() == tag]
+            by_tag = {}
+            for element in self.__sub_elements:
+                by_tag.setdefault(element.get_tag(), []).append(element)
+            self.__by_tag = by_tag
+        return list(self.__by_tag.get(tag, ()))
 
     def get_level(self) -> int:
         """Get the level of the Gedcom element.
@@ -162,13 +210,16 @@ class GedcomElement:
         :return: The Gedcom representation of the Gedcom element.
         :rtype: str
         """
-        gedcom = [self.get_level()]
-        if hasattr(self, "get_xref") and self.get_xref():
-            gedcom.append(self.get_xref())
-        gedcom.append(self.get_tag())
-        if self.get_value():
-            gedcom.append(self.get_value())
-        return f"{' '.join([str(x) for x in gedcom])}\n"
+        gedcom = [str(self.__level)]
+        get_xref = getattr(self, "get_xref", None)
+        xref = get_xref() if get_xref is not None else None
+        if xref:
+            gedcom.append(str(xref))
+        gedcom.append(str(self.__tag))
+        value = self.__value
+        if value:
+            gedcom.append(str(value))
+        return " ".join(gedcom) + "\n"
 
     def extract_gedcom(self) -> str:
         """Extract the Gedcom element.
@@ -176,7 +227,7 @@ class GedcomElement:
         :return: The extracted Gedcom element.
         :rtype: str
         """
-        return f"{self.get_gedcom()}{''.join([element.extract_gedcom() for element in self.get_sub_elements()])}"
+        return self.get_gedcom() + "".join([element.extract_gedcom() for element in self.__sub_elements])
 
     def export(self) -> dict:
         """Export the Gedcom element.
@@ -186,13 +237,21 @@ class GedcomElement:
         """
 
         export_dict = {}
-        prefix = f"_{self.__class__.__name__}__export_"
-        for attr in dir(self):
-            if attr.startswith(prefix):
-                export_key = attr.replace(prefix, "")
-                export_value = getattr(self, attr)
-                if isinstance(export_value, GedcomElement):
-                    export_dict[export_key] = export_value.export()
-                else:
-                    export_dict[export_key] = export_value
+        cls = self.__class__
+        prefix = f"_{cls.__name__}__export_"
+        if cls not in _EXPORT_ATTRIBUTES:
+            _EXPORT_ATTRIBUTES[cls] = (
+                [attr for attr in dir(cls) if attr.startswith(prefix)],
+                all("__slots__" in vars(klass) for klass in cls.__mro__[:-1]),
+            )
+        export_attrs, slots_only = _EXPORT_ATTRIBUTES[cls]
+        if not slots_only:
+            # Attributes stored in the instance __dict__ can differ from one instance to another.
+            export_attrs = sorted(set(export_attrs).union(attr for attr in vars(self) if attr.startswith(prefix)))
+        prefix_length = len(prefix)
+        for attr in export_attrs:
+            export_value = getattr(self, attr)
+            if isinstance(export_value, GedcomElement):
+                export_value = export_value.export()
+            export_dict[attr[prefix_length:]] = export_value
         return export_dict
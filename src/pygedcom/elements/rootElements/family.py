@@ -17,6 +17,17 @@ class GedcomFamily(GedcomRootElement):
     :rtype: GedcomFamily
     """
 
+    __slots__ = (
+        "__export_husband",
+        "__export_wife",
+        "__export_children",
+        "__export_married",
+        "__export_marriage",
+        "__export_media",
+    )
+
+    _sub_element_classes = {"MARR": GedcomCommonEvent}
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the family."""
         super().__init__(level, xref, tag, sub_elements)
@@ -33,13 +44,8 @@ class GedcomFamily(GedcomRootElement):
         :return: The marriage of the family.
         :rtype: GedcomCommonEvent
         """
-        if self.find_sub_element("MARR") != []:
-            marriage = self.find_sub_element("MARR")[0]
-            marriage.__class__ = GedcomCommonEvent
-            marriage.init_properties()
-            return marriage
-        else:
-            return GedcomCommonEvent.empty()
+        marriages = self.find_sub_element("MARR")
+        return marriages[0] if marriages != [] else GedcomCommonEvent.empty()
 
     def __find_husband(self) -> str:
         """Find the husband of the family.
@@ -47,10 +53,10 @@ class GedcomFamily(GedcomRootElement):
         :return: The husband of the family.
         :rtype: str
         """
-        if self.find_sub_element("HUSB") != []:
-            return self.find_sub_element("HUSB")[0].get_value()
-        else:
-            return ""
+        husband = self.find_sub_element("HUSB")
+        if husband != []:
+            return husband[0].get_value()
+        return ""
 
     def __find_wife(self) -> str:
         """Find the wife of the family.
@@ -58,10 +64,10 @@ class GedcomFamily(GedcomRootElement):
         :return: The wife of the family.
         :rtype: str
         """
-        if self.find_sub_element("WIFE") != []:
-            return self.find_sub_element("WIFE")[0].get_value()
-        else:
-            return ""
+        wife = self.find_sub_element("WIFE")
+        if wife != []:
+            return wife[0].get_value()
+        return ""
 
     def __find_children(self) -> list[str]:
         """Find the children of the family.
@@ -80,9 +86,10 @@ class GedcomFamily(GedcomRootElement):
         :return: True if the family is married, False otherwise.
         :rtype: bool
         """
-        return self.find_sub_element("MARR") != [] or (
-            self.find_sub_element("_UST")[0].get_value() == "MARRIED" if self.find_sub_element("_UST") != [] else False
-        )
+        if self.find_sub_element("MARR") != []:
+            return True
+        status = self.find_sub_element("_UST")
+        return status[0].get_value() == "MARRIED" if status != [] else False
 
     def __find_media(self) -> list:
         """Find the media of the family.
@@ -214,9 +221,9 @@ class GedcomFamily(GedcomRootElement):
         :type parent_xref: str
         """
         for parent in ["HUSB", "WIFE"]:
-            if self.find_sub_element(parent) != []:
-                if self.find_sub_element(parent)[0].get_value() == parent_xref:
-                    self.remove_sub_element(self.find_sub_element(parent)[0])
+            parent_elements = self.find_sub_element(parent)
+            if parent_elements != [] and parent_elements[0].get_value() == parent_xref:
+                self.remove_sub_element(parent_elements[0])
         if self.__export_husband == parent_xref:
             self.__export_husband = ""
         if self.__export_wife == parent_xref:
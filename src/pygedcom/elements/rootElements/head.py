@@ -14,6 +14,8 @@ class GedcomHead(GedcomRootElement):
     :rtype: GedcomHead
     """
 
+    __slots__ = ()
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the HEAD element."""
         super().__init__(level, xref, tag, sub_elements)
@@ -17,6 +17,18 @@ class GedcomIndividual(GedcomRootElement):
     :rtype: GedcomIndividual
     """
 
+    __slots__ = (
+        "__export_name",
+        "__export_first_name",
+        "__export_last_name",
+        "__export_birth",
+        "__export_death",
+        "__export_sex",
+        "__export_media",
+    )
+
+    _sub_element_classes = {"BIRT": GedcomCommonEvent, "DEAT": GedcomCommonEvent}
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the individual."""
         super().__init__(level, xref, tag, sub_elements)
@@ -34,10 +46,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The name of the individual.
         :rtype: str
         """
-        if self.find_sub_element("NAME") != []:
-            return self.find_sub_element("NAME")[0].get_value()
-        else:
-            return ""
+        names = self.find_sub_element("NAME")
+        return names[0].get_value() if names != [] else ""
 
     def __find_first_name(self):
         """Find the first name of the individual.
@@ -45,7 +55,7 @@ class GedcomIndividual(GedcomRootElement):
         :return: The first name of the individual.
         :rtype: str
         """
-        return self.__export_name.split("/")[0].split(" ")[0].strip()
+        return self.__export_name.split("/", 1)[0].split(" ", 1)[0].strip()
 
     def __find_last_name(self):
         """Find the last name of the individual.
@@ -53,7 +63,7 @@ class GedcomIndividual(GedcomRootElement):
         :return: The last name of the individual.
         :rtype: str
         """
-        return self.__export_name.split("/")[-2].strip() if self.__export_name else ""
+        return self.__export_name.rsplit("/", 2)[-2].strip() if "/" in self.__export_name else ""
 
     def __init_birth(self) -> GedcomCommonEvent:
         """Initialize the birth of the individual.
@@ -61,13 +71,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The birth of the individual.
         :rtype: GedcomCommonEvent
         """
-        if self.find_sub_element("BIRT") != []:
-            birth = self.find_sub_element("BIRT")[0]
-            birth.__class__ = GedcomCommonEvent
-            birth.init_properties()
-            return birth
-        else:
-            return GedcomCommonEvent.empty()
+        births = self.find_sub_element("BIRT")
+        return births[0] if births != [] else GedcomCommonEvent.empty()
 
     def __init_death(self) -> GedcomCommonEvent:
         """Initialize the death of the individual.
@@ -75,13 +80,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The death of the individual.
         :rtype: GedcomCommonEvent
         """
-        if self.find_sub_element("DEAT") != []:
-            death = self.find_sub_element("DEAT")[0]
-            death.__class__ = GedcomCommonEvent
-            death.init_properties()
-            return death
-        else:
-            return GedcomCommonEvent.empty()
+        deaths = self.find_sub_element("DEAT")
+        return deaths[0] if deaths != [] else GedcomCommonEvent.empty()
 
     def __find_sex(self):
         """Find the sex of the individual.
@@ -89,7 +89,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The sex of the individual.
         :rtype: str
         """
-        return self.find_sub_element("SEX")[0].get_value() if self.find_sub_element("SEX") != [] else ""
+        sexes = self.find_sub_element("SEX")
+        return sexes[0].get_value() if sexes != [] else ""
 
     def __find_media(self) -> list:
         """Find media of the individual.
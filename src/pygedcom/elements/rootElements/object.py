@@ -16,6 +16,8 @@ class GedcomObject(GedcomRootElement):
     :rtype: GedcomObject
     """
 
+    __slots__ = ("__export_file", "__export_format")
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom object."""
         super().__init__(level, xref, tag, sub_elements)
@@ -28,10 +30,10 @@ class GedcomObject(GedcomRootElement):
         :return: The file path of the Gedcom object.
         :rtype: str
         """
-        if self.find_sub_element("FILE") != []:
-            return self.find_sub_element("FILE")[0].get_value()
-        else:
-            return ""
+        files = self.find_sub_element("FILE")
+        if files != []:
+            return files[0].get_value()
+        return ""
 
     def __find_format(self) -> str:
         """Find the format of the Gedcom object.
@@ -39,10 +41,10 @@ class GedcomObject(GedcomRootElement):
         :return: The format of the Gedcom object.
         :rtype: str
         """
-        if self.find_sub_element("FORM") != []:
-            return self.find_sub_element("FORM")[0].get_value()
-        else:
-            return ""
+        formats = self.find_sub_element("FORM")
+        if formats != []:
+            return formats[0].get_value()
+        return ""
 
     def get_file(self) -> str:
         """Get the file path of the Gedcom object.
@@ -16,6 +16,8 @@ class GedcomRepository(GedcomRootElement):
     :rtype: GedcomRepository
     """
 
+    __slots__ = ("__export_name",)
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom repository."""
         super().__init__(level, xref, tag, sub_elements)
@@ -16,6 +16,8 @@ class GedcomRootElement(GedcomElement):
     :rtype: RootGedcomElement
     """
 
+    __slots__ = ("__xref",)
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the rootElement."""
         super().__init__(level, tag, sub_elements)
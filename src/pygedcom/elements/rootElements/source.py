@@ -17,6 +17,16 @@ class GedcomSource(GedcomRootElement):
     :rtype: GedcomSource
     """
 
+    __slots__ = (
+        "__export_quality",
+        "__export_title",
+        "__export_type",
+        "__export_object",
+        "__export_repo",
+        "__export_media_type",
+        "__export_note",
+    )
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom source."""
         super().__init__(level, xref, tag, sub_elements)
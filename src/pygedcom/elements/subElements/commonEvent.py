@@ -41,13 +41,13 @@ class GedcomCommonEvent(GedcomElement):
         :return: The place of the common event.
         :rtype: GedcomPlace
         """
-        if self.find_sub_element("PLAC") != []:
-            place = self.find_sub_element("PLAC")[0]
+        places = self.find_sub_element("PLAC")
+        if places != []:
+            place = places[0]
             place.__class__ = GedcomPlace
             place.init_properties()
             return place
-        else:
-            return GedcomPlace.empty()
+        return GedcomPlace.empty()
 
     def __find_date(self) -> GedcomDate:
         """Find the date of the common event.
@@ -55,13 +55,13 @@ class GedcomCommonEvent(GedcomElement):
         :return: The date of the common event.
         :rtype: GedcomDate
         """
-        if self.find_sub_element("DATE") != []:
-            date = self.find_sub_element("DATE")[0]
+        dates = self.find_sub_element("DATE")
+        if dates != []:
+            date = dates[0]
             date.__class__ = GedcomDate
             date.init_properties()
             return date
-        else:
-            return GedcomDate.empty()
+        return GedcomDate.empty()
 
     def __find_media(self) -> list:
         """Find the media of the common event.
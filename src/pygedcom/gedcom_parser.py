@@ -1,5 +1,13 @@
 import json
-import chardet
+import sys
+from typing import TextIO
+
+from chardet import UniversalDetector
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard json module is used as a fallback
+    orjson = None
 
 from .elements.rootElements.rootElement import GedcomRootElement
 from .elements.rootElements.family import GedcomFamily
@@ -12,6 +20,17 @@ from .elements.rootElements.submitter import GedcomSubmitter
 from .elements.rootElements.note import GedcomNote
 from .elements.element import GedcomElement
 
+# Root element classes by tag. HEAD and TRLR are handled separately by the parser.
+_ELEMENT_FACTORIES = {
+    "INDI": GedcomIndividual,
+    "FAM": GedcomFamily,
+    "SOUR": GedcomSource,
+    "REPO": GedcomRepository,
+    "OBJE": GedcomObject,
+    "SUBM": GedcomSubmitter,
+    "NOTE": GedcomNote,
+}
+
 
 class GedcomParser:
     """The GEDCOM parser main class.
@@ -27,6 +46,10 @@ class GedcomParser:
 
     def __init__(self, path: str):
         self.path = path
+        self.__reset()
+
+    def __reset(self):
+        """Reset the parsed elements and their lookup tables."""
         self.head = None
         self.individuals = []
         self.families = []
@@ -36,50 +59,90 @@ class GedcomParser:
         self.submitters = []
         self.notes = []
         self.isTRLR = False
+        self.__individuals_by_xref = {}
+        self.__families_by_xref = {}
+        self.__sources_by_xref = {}
+        self.__objects_by_xref = {}
+        self.__repositories_by_xref = {}
+        self.__collections = {
+            "INDI": self.individuals,
+            "FAM": self.families,
+            "SOUR": self.sources,
+            "REPO": self.repositories,
+            "OBJE": self.objects,
+            "SUBM": self.submitters,
+            "NOTE": self.notes,
+        }
+        self.__indexes = {
+            "INDI": self.__individuals_by_xref,
+            "FAM": self.__families_by_xref,
+            "SOUR": self.__sources_by_xref,
+            "REPO": self.__repositories_by_xref,
+            "OBJE": self.__objects_by_xref,
+        }
 
-    def __open(self) -> str:
-        """Open the GEDCOM file and return the content.
+    def __open(self) -> TextIO:
+        """Open the GEDCOM file for line-by-line reading.
 
-        :return: The content of the GEDCOM file.
-        :rtype: str
+        The encoding is detected incrementally so the file is never loaded in memory at once.
+
+        :return: The opened GEDCOM file, to be used as a context manager.
+        :rtype: TextIO
+        :raises ValueError: If the file can't be decoded with any supported encoding.
         """
         supported_encodings = ["utf-8", "utf-16", "latin1", "ansi"]
-        with open(self.path, 'rb') as file:
-            raw_data = file.read()
-            result = chardet.detect(raw_data, True)
-            encoding = result['encoding']
-            confidence = result['confidence']
-            if confidence >= 1.0:
-                print(f"Detected encoding: {encoding}")
-                supported_encodings.insert(0, encoding)
-            else:
-                print(f"Can't detect encoding by chardet, most possible is: {encoding} with confidence {confidence}")
-
+        detector = UniversalDetector(should_rename_legacy=True)
+        with open(self.path, "rb") as file:
+            for raw_line in file:
+                detector.feed(raw_line)
+                if detector.done:
+                    break
+        result = detector.close()
+        encoding = result["encoding"]
+        confidence = result["confidence"]
+        if confidence >= 1.0:
+            print(f"Detected encoding: {encoding}")
+            supported_encodings.insert(0, encoding)
+        else:
+            print(f"Can't detect encoding by chardet, most possible is: {encoding} with confidence {confidence}")
 
         for encoding in supported_encodings:
             try:
-                with open(self.path, "r", encoding=encoding) as file:
-                    return file.read()
+                file = open(self.path, "r", encoding=encoding, buffering=1 << 20)
+            except LookupError:
+                continue
+            try:
+                # Decode the whole file once to make sure the encoding is valid before handing it out.
+                for _ in file:
+                    pass
             except UnicodeDecodeError:
+                file.close()
                 continue
+            file.seek(0)
+            return file
         raise ValueError(
             f"Could not open file {self.path} with supported encodings ({', '.join(supported_encodings)})."
         )
 
-    def __parse_line(self, line: str) -> dict:
+    def __parse_line(self, line: str) -> tuple:
         """Parse a line of a GEDCOM file.
 
         :param line: The line to parse.
         :type line: str
-        :return: A dictionary with the level, the xref, the tag and the value.
-        :rtype: dict
+        :return: A tuple with the level, the xref, the tag and the value.
+        :rtype: tuple
         """
-        chars = line.split(" ")
-        level = int(chars.pop(0))
-        xref = chars.pop(0) if chars[0].startswith("@") else None
-        tag = chars.pop(0)
-        value = " ".join(chars) if chars != [] else ""
-        return {"level": level, "xref": xref, "tag": tag, "value": value}
+        parts = line.split(" ", 2)
+        level = int(parts[0])
+        if parts[1][:1] == "@":
+            xref = parts[1]
+            parts = parts[2].split(" ", 1)
+        else:
+            xref = None
+            del parts[0]
+        tag = sys.intern(parts[0])
+        value = parts[1] if len(parts) > 1 else ""
+        return level, xref, tag, value
 
     def verify(self) -> dict:
         """Verify the file is a valid GEDCOM file. This only checks the level of each line, not the content.
@@ -87,103 +150,45 @@ class GedcomParser:
         :return: A dictionary with the status and the message.
         :rtype: dict
         """
-        file = self.__open()
-        lines = file.split("\n")
         current_level = 0
-        current_line = 0
-        for line in lines:
-            current_line += 1
-            if line != "":
-                # Check if the level is valid
-                parsed_line = self.__parse_line(line)
-                if parsed_line["level"] > current_level + 1:
-                    return {
-                        "status": "error",
-                        "message": "Invalid level on line " + str(current_line) + ": " + line,
-                    }
-                current_level = parsed_line["level"]
+        with self.__open() as file:
+            for current_line, line in enumerate(file, start=1):
+                line = line.rstrip("\n\r")
+                if line != "":
+                    # Check if the level is valid
+                    level = int(line.partition(" ")[0])
+                    if level > current_level + 1:
+                        return {
+                            "status": "error",
+                            "message": "Invalid level on line " + str(current_line) + ": " + line,
+                        }
+                    current_level = level
         return {"status": "ok", "message": ""}
 
-    def __create_element(self, parsed_line: dict, element_lines: list):
+    def __create_element(self, parsed_line: tuple, element_lines: list):
         """Create an element based on the parsed line and the element lines.
 
-        :param parsed_line: The parsed line.
-        :type parsed_line: dict
+        :param parsed_line: The parsed line, as returned by __parse_line.
+        :type parsed_line: tuple
         :param element_lines: The lines of the element.
         :type element_lines: list
         """
-        if parsed_line["tag"] == "INDI":
-            self.individuals.append(
-                GedcomIndividual(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "FAM":
-            self.families.append(
-                GedcomFamily(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "HEAD":
-            self.head = GedcomHead(
-                parsed_line["level"],
-                "",  # No xref for HEAD
-                parsed_line["tag"],
-                element_lines,
-            )
-        elif parsed_line["tag"] == "SOUR":
-            self.sources.append(
-                GedcomSource(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "REPO":
-            self.repositories.append(
-                GedcomRepository(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "OBJE":
-            self.objects.append(
-                GedcomObject(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "TRLR":
+        level, xref, tag, _ = parsed_line
+        if tag == "HEAD":
+            self.head = GedcomHead(level, "", tag, element_lines)  # No xref for HEAD
+            return
+        if tag == "TRLR":
             self.isTRLR = True
-        elif parsed_line["tag"] == "SUBM":
-            self.submitters.append(
-                GedcomSubmitter(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "NOTE":
-            self.notes.append(
-                GedcomNote(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
+            return
+        factory = _ELEMENT_FACTORIES.get(tag)
+        if factory is None:
+            return
+        element = factory(level, xref, tag, element_lines)
+        self.__collections[tag].append(element)
+        index = self.__indexes.get(tag)
+        if index is not None:
+            # Keep the first record when the file has duplicate xrefs
+            index.setdefault(xref, element)
 
     def parse(self) -> dict:
         """Parse the GEDCOM file and return a dictionary with the parsed elements
@@ -191,29 +196,27 @@ class GedcomParser:
         :return: A dictionary with the parsed elements.
         :rtype: dict
         """
-        self.head = None
-        self.submitters = []
-        self.individuals = []
-        self.families = []
-        self.sources = []
-        self.objects = []
-        self.notes = []
-        self.repositories = []
-        file = self.__open()
-        lines = file.split("\n")
-        current_parsed_line = self.__parse_line(lines[0])
-        element_lines = []
-        if lines != []:
-            for line in lines[1:]:
+        self.__reset()
+        with self.__open() as file:
+            current_parsed_line = None
+            for line in file:
+                line = line.rstrip("\n\r")
                 if line != "":
-                    tmp_parsed_line = self.__parse_line(line)
-                    if tmp_parsed_line["level"] > 0:
-                        element_lines.append(line)
-                    else:
-                        self.__create_element(current_parsed_line, element_lines)
-                        current_parsed_line = tmp_parsed_line
-                        element_lines = []
-            self.__create_element(current_parsed_line, element_lines)
+                    current_parsed_line = self.__parse_line(line)
+                    break
+            if current_parsed_line is not None:
+                element_lines = []
+                for line in file:
+                    line = line.rstrip("\n\r")
+                    if line != "":
+                        # Only root lines are parsed here, sub lines are parsed once by their root element.
+                        if line[:2] != "0 ":
+                            element_lines.append(line)
+                        else:
+                            self.__create_element(current_parsed_line, element_lines)
+                            current_parsed_line = self.__parse_line(line)
+                            element_lines = []
+                self.__create_element(current_parsed_line, element_lines)
         return {
             "head": self.head,
             "individuals": self.individuals,
@@ -281,58 +284,41 @@ class GedcomParser:
             export = {}
             if empty_fields or self.head:
                 export["head"] = self.head.export() if self.head else ""
-            if empty_fields or self.submitters:
-                export["submitters"] = {}
-                for submitter in self.submitters:
-                    export["submitters"][submitter.get_xref()] = submitter.export()
-            if empty_fields or self.individuals:
-                export["individuals"] = {}
-                for individual in self.individuals:
-                    export["individuals"][individual.get_xref()] = individual.export()
-            if empty_fields or self.families:
-                export["families"] = {}
-                for family in self.families:
-                    export["families"][family.get_xref()] = family.export()
-            if empty_fields or self.objects:
-                export["objects"] = {}
-                for object in self.objects:
-                    export["objects"][object.get_xref()] = object.export()
-            if empty_fields or self.notes:
-                export["notes"] = {}
-                for note in self.notes:
-                    export["notes"][note.get_xref()] = note.export()
-            if empty_fields or self.repositories:
-                export["repositories"] = {}
-                for repository in self.repositories:
-                    export["repositories"][repository.get_xref()] = repository.export()
-            if empty_fields or self.sources:
-                export["sources"] = {}
-                for source in self.sources:
-                    export["sources"][source.get_xref()] = source.export()
+            collections = {
+                "submitters": self.submitters,
+                "individuals": self.individuals,
+                "families": self.families,
+                "objects": self.objects,
+                "notes": self.notes,
+                "repositories": self.repositories,
+                "sources": self.sources,
+            }
+            for key, collection in collections.items():
+                if empty_fields or collection:
+                    export[key] = {element.get_xref(): element.export() for element in collection}
 
             if not empty_fields:
                 self.__remove_empty(export)
-            return json.dumps(export, indent=4, ensure_ascii=False)
+            if orjson is not None:
+                return orjson.dumps(export, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+            return json.dumps(export, indent=2, ensure_ascii=False)
         if format == "gedcom":
-            content = ""
+            parts = []
             if self.head:
-                content += self.head.extract_gedcom()
-            for submitter in self.submitters:
-                content += submitter.extract_gedcom()
-            for individual in self.individuals:
-                content += individual.extract_gedcom()
-            for family in self.families:
-                content += family.extract_gedcom()
-            for object in self.objects:
-                content += object.extract_gedcom()
-            for note in self.notes:
-                content += note.extract_gedcom()
-            for repository in self.repositories:
-                content += repository.extract_gedcom()
-            for source in self.sources:
-                content += source.extract_gedcom()
-            content += "0 TRLR\n" if self.isTRLR else ""
-            return content
+                parts.append(self.head.extract_gedcom())
+            for collection in (
+                self.submitters,
+                self.individuals,
+                self.families,
+                self.objects,
+                self.notes,
+                self.repositories,
+                self.sources,
+            ):
+                parts.extend(element.extract_gedcom() for element in collection)
+            if self.isTRLR:
+                parts.append("0 TRLR\n")
+            return "".join(parts)
 
     def get_parents(self, individual: GedcomIndividual) -> list:
         """Get the parents of an individual.
@@ -366,20 +352,21 @@ class GedcomParser:
                     children.append(self.find_individual(child))
         return children
 
-    def __find_root_element(self, collection: list, xref: str) -> GedcomElement:
-        """Find an element in a collection by its xref.
+    def __find_root_element(self, index: dict, xref: str) -> GedcomElement:
+        """Find an element in a collection index by its xref.
 
-        :param collection: The collection to search in.
-        :type collection: list
+        :param index: The xref index of the collection to search in.
+        :type index: dict
         :param xref: The xref to search for.
         :type xref: str
-        :return: The element if found, None otherwise.
+        :return: The element if found.
         :rtype: GedcomElement
+        :raises KeyError: If the element does not exist.
         """
-        for element in collection:
-            if element.get_xref() == xref:
-                return element
-        raise KeyError("Element with xref " + xref + " not found.")
+        element = index.get(xref)
+        if element is None:
+            raise KeyError("Element with xref " + xref + " not found.")
+        return element
 
     def find_individual(self, xref: str) -> GedcomIndividual:
         """Find an individual by its xref.
@@ -389,7 +376,7 @@ class GedcomParser:
         :return: The individual if found, None otherwise.
         :rtype: GedcomIndividual
         """
-        return self.__find_root_element(self.individuals, xref)
+        return self.__find_root_element(self.__individuals_by_xref, xref)
 
     def find_family(self, xref: str) -> GedcomFamily:
         """Find a family by its xref.
@@ -399,7 +386,7 @@ class GedcomParser:
         :return: The family if found, None otherwise.
         :rtype: GedcomFamily
         """
-        return self.__find_root_element(self.families, xref)
+        return self.__find_root_element(self.__families_by_xref, xref)
 
     def find_source(self, xref: str) -> GedcomSource:
         """Find a source by its xref.
@@ -409,7 +396,7 @@ class GedcomParser:
         :return: The source if found, None otherwise.
         :rtype: GedcomSource
         """
-        return self.__find_root_element(self.sources, xref)
+        return self.__find_root_element(self.__sources_by_xref, xref)
 
     def find_object(self, xref: str) -> GedcomObject:
         """Find an object by its xref.
@@ -419,7 +406,7 @@ class GedcomParser:
         :return: The object if found, None otherwise.
         :rtype: GedcomObject
         """
-        return self.__find_root_element(self.objects, xref)
+        return self.__find_root_element(self.__objects_by_xref, xref)
 
     def find_repository(self, xref: str) -> GedcomRepository:
         """Find a repository by its xref.
@@ -429,23 +416,23 @@ class GedcomParser:
         :return: The repository if found, None otherwise.
         :rtype: GedcomRepository
         """
-        return self.__find_root_element(self.repositories, xref)
+        return self.__find_root_element(self.__repositories_by_xref, xref)
 
-    def __add_root_element(self, collection: list, element: GedcomRootElement):
+    def __add_root_element(self, collection: list, index: dict, element: GedcomRootElement):
         """Add an element to a collection.
 
         :param collection: The collection to add the element to.
         :type collection: list
+        :param index: The xref index of the collection.
+        :type index: dict
         :param element: The element to add.
         :type element: GedcomRootElement
         :raises KeyError: If the element already exists.
         """
-        try:
-            self.__find_root_element(collection, element.get_xref())
-        except KeyError:
-            collection.append(element)
-        else:
+        if element.get_xref() in index:
             raise KeyError("Element with xref " + element.get_xref() + " already exists.")
+        collection.append(element)
+        index[element.get_xref()] = element
 
     def add_individual(self, individual: GedcomIndividual):
         """Add an individual to the collection.
@@ -458,7 +445,7 @@ class GedcomParser:
         if not isinstance(individual, GedcomIndividual):
             raise TypeError("Individual must be of type GedcomIndividual.")
         try:
-            self.__add_root_element(self.individuals, individual)
+            self.__add_root_element(self.individuals, self.__individuals_by_xref, individual)
         except KeyError:
             raise KeyError("Individual with xref " + individual.get_xref() + " already exists.")
 
@@ -486,7 +473,7 @@ class GedcomParser:
         if not isinstance(family, GedcomFamily):
             raise TypeError("Family must be of type GedcomFamily.")
         try:
-            self.__add_root_element(self.families, family)
+            self.__add_root_element(self.families, self.__families_by_xref, family)
         except KeyError:
             raise KeyError("Family with xref " + family.get_xref() + " already exists.")
 
@@ -501,10 +488,9 @@ class GedcomParser:
         if not isinstance(source, GedcomSource):
             raise TypeError("Source must be of type GedcomSource.")
         try:
-            self.__add_root_element(self.sources, source)
+            self.__add_root_element(self.sources, self.__sources_by_xref, source)
         except KeyError:
             raise KeyError("Source with xref " + source.get_xref() + " already exists.")
-        self.sources.append(source)
 
     def add_object(self, object: GedcomObject):
         """Add an object to the collection.
@@ -517,10 +503,9 @@ class GedcomParser:
         if not isinstance(object, GedcomObject):
             raise TypeError("Object must be of type GedcomObject.")
         try:
-            self.__add_root_element(self.objects, object)
+            self.__add_root_element(self.objects, self.__objects_by_xref, object)
         except KeyError:
             raise KeyError("Object with xref " + object.get_xref() + " already exists.")
-        self.objects.append(object)
 
     def add_repository(self, repository: GedcomRepository):
         """Add a repository to the collection.
@@ -533,24 +518,29 @@ class GedcomParser:
         if not isinstance(repository, GedcomRepository):
             raise TypeError("Repository must be of type GedcomRepository.")
         try:
-            self.__add_root_element(self.repositories, repository)
+            self.__add_root_element(self.repositories, self.__repositories_by_xref, repository)
         except KeyError:
             raise KeyError("Repository with xref " + repository.get_xref() + " already exists.")
-        self.repositories.append(repository)
 
-    def __remove_root_element(self, collection: list, xref: str):
+    def __remove_root_element(self, collection: list, index: dict, xref: str):
         """Remove an element from a collection.
 
         :param collection: The collection to remove the element from.
         :type collection: list
+        :param index: The xref index of the collection.
+        :type index: dict
         :param xref: The xref of the element to remove.
         :type xref: str
         :raises KeyError: If the element does not exist.
         """
-        element = self.__find_root_element(collection, xref)
-        if not element:
-            raise KeyError()
+        element = self.__find_root_element(index, xref)
         collection.remove(element)
+        # Fall back on the next record with the same xref, if the file has duplicates
+        duplicate = next((other for other in collection if other.get_xref() == xref), None)
+        if duplicate is None:
+            del index[xref]
+        else:
+            index[xref] = duplicate
 
     def remove_individual(self, xref: str):
         """Remove an individual from the collection and all mentions of it in families.
@@ -570,7 +560,7 @@ class GedcomParser:
             family.remove_parent(xref)
             family.remove_child(xref)
 
-        self.__remove_root_element(self.individuals, xref)
+        self.__remove_root_element(self.individuals, self.__individuals_by_xref, xref)
 
     def remove_family(self, xref: str):
         """Remove a family from the collection.
@@ -589,4 +579,4 @@ class GedcomParser:
         for individual in self.individuals:
             individual.remove_family(xref)
 
-        self.__remove_root_element(self.families, xref)
+        self.__remove_root_element(self.families, self.__families_by_xref, xref)
@@ -1,4 +1,7 @@
 import json
+
+import pytest
+
 from ..src.pygedcom import gedcom_parser
 
 
@@ -124,3 +127,12 @@ def test_export_gedcom_20():
     result = parser.export(format="gedcom")
     with open("test/samples/20_complex_sample.ged") as f:
         assert result == f.read()
+
+
+def test_export_json_without_orjson_20(monkeypatch):
+    pytest.importorskip("orjson")
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    parser.parse()
+    expected = parser.export()
+    monkeypatch.setattr(gedcom_parser, "orjson", None)
+    assert parser.export() == expected
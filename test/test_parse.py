@@ -1,4 +1,5 @@
 from ..src.pygedcom import gedcom_parser
+from ..src.pygedcom.elements.rootElements.individual import GedcomIndividual
 
 
 def test_parse_00():
@@ -26,6 +27,14 @@ def test_parse_04():
     assert str(result["individuals"][1].get_death().get_date()) == "MAR 2075"
 
 
+def test_parse_11():
+    parser = gedcom_parser.GedcomParser("test/samples/11_empty_file.ged")
+    result = parser.parse()
+    assert result["head"] is None
+    assert len(result["individuals"]) == 0
+    assert len(result["families"]) == 0
+
+
 def test_parse_30():
     # Same as 00 but with 'utf-8-sig' encoding, which should be auto-detected
     parser = gedcom_parser.GedcomParser("test/samples/30_utf_8_sig_encoding.ged")
@@ -34,3 +43,9 @@ def test_parse_30():
     assert result["individuals"][0].get_name() == "John /Doe/"
     assert str(result["individuals"][0].get_birth().get_date()) == "01 JAN 1900"
     assert str(result["individuals"][0].get_death().get_date()) == "01 JAN 1970"
+
+
+def test_parse_individual_name_without_surname():
+    individual = GedcomIndividual(0, "@I1@", "INDI", ["1 NAME John"])
+    assert individual.get_first_name() == "John"
+    assert individual.get_last_name() == ""
@@ -1,5 +1,9 @@
 import json
+
+import pytest
+
 from ..src.pygedcom import gedcom_parser
+from ..src.pygedcom.elements.rootElements.individual import GedcomIndividual
 
 
 def test_remove_individual():
@@ -52,3 +56,50 @@ def test_remove_family():
     assert result["individuals"]["@I1@"]["name"] == "John /Travolta/"
     assert result["individuals"]["@I2@"]["name"] == "Jane /Travolta/"
     assert result["families"] == {}
+
+
+def test_remove_individual_not_found_anymore():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    assert parser.find_individual("@I1@").get_name() == "John /Travolta/"
+
+    parser.remove_individual("@I1@")
+    with pytest.raises(KeyError):
+        parser.find_individual("@I1@")
+    with pytest.raises(KeyError):
+        parser.remove_individual("@I1@")
+
+
+def test_remove_family_from_individual_with_many_sub_elements():
+    individual = GedcomIndividual(0, "@I1@", "INDI", [f"1 FAMS @F{i}@" for i in range(10)])
+    assert len(individual.find_sub_element("FAMS")) == 10
+    individual.remove_family("@F3@")
+    assert "@F3@" not in [family.get_value() for family in individual.find_sub_element("FAMS")]
+    individual.add_sub_element(1, "FAMC", [], value="@F10@")
+    assert [family.get_value() for family in individual.find_sub_element("FAMC")] == ["@F10@"]
+
+
+def test_remove_individual_duplicate_xref():
+    parser = gedcom_parser.GedcomParser("test/samples/12_duplicate_xref.ged")
+    parser.parse()
+    assert len(parser.individuals) == 2
+    assert parser.find_individual("@I1@").get_name() == "A /B/"
+
+    parser.remove_individual("@I1@")
+    assert len(parser.individuals) == 1
+    assert parser.find_individual("@I1@").get_name() == "C /D/"
+    with pytest.raises(KeyError):
+        parser.add_individual(GedcomIndividual(0, "@I1@", "INDI", []))
+
+    parser.remove_individual("@I1@")
+    assert parser.individuals == []
+    with pytest.raises(KeyError):
+        parser.find_individual("@I1@")
+
+
+def test_get_sub_elements_returns_a_copy():
+    individual = GedcomIndividual(0, "@I1@", "INDI", [f"1 FAMS @F{i}@" for i in range(10)])
+    assert len(individual.find_sub_element("FAMS")) == 10
+    individual.get_sub_elements().append(individual.find_sub_element("FAMS")[0])
+    assert len(individual.get_sub_elements()) == 10
+    assert individual.extract_gedcom().count("FAMS") == 10